@@ -8,88 +8,263 @@ deploy it alongside static assets without a dedicated backend server.
 
 from __future__ import annotations
 
+import gzip
+import heapq
 import json
 import os
+import threading
+import time
 import urllib.error
 import urllib.request
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timezone
+from functools import lru_cache
 from http import HTTPStatus
 from http.server import BaseHTTPRequestHandler
-from typing import Any, Dict, List
-from urllib.parse import parse_qs, urlparse
+from operator import itemgetter
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping
+
+try:
+    import urllib3
+except ImportError:  # pragma: no cover - fall back to urllib.request
+    urllib3 = None
+
+try:
+    import orjson
+
+    _loads = orjson.loads
+    _dumps = orjson.dumps
+except ImportError:  # pragma: no cover - fall back to the stdlib codec
+    _loads = json.loads
+
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode("utf-8")
 
 BASE_URL = os.getenv("NOF1_BASE_URL", "https://nof1.ai/api").rstrip("/")
 DEFAULT_LIMIT = int(os.getenv("TRADE_DISPLAY_LIMIT", "60"))
 POSITIONS_LIMIT = int(os.getenv("TRADE_POSITIONS_LIMIT", "200"))
+TTL_TRADES = float(os.getenv("TRADE_CACHE_TTL_TRADES", "5"))
+TTL_POSITIONS = float(os.getenv("TRADE_CACHE_TTL_POSITIONS", "5"))
+TTL_TOTALS = float(os.getenv("TRADE_CACHE_TTL_TOTALS", "10"))
+STALE_HEADER = "X-Upstream-Stale"
+
+# Response headers shared by every reply, pre-encoded once at import time.
+_FIXED_HEADERS = (
+    b"Content-Type: application/json; charset=utf-8\r\n"
+    b"Cache-Control: no-store, max-age=0\r\n"
+    b"Access-Control-Allow-Origin: *\r\n"
+    b"Access-Control-Allow-Methods: GET, OPTIONS\r\n"
+    b"Access-Control-Allow-Headers: Content-Type, Authorization\r\n"
+)
 
 HEADERS = {
     "Accept": "application/json",
     "User-Agent": "Mozilla/5.0 (compatible; AlphaArenaTicker/1.0; +https://vercel.com/)",
     "Accept-Language": "en-US,en;q=0.9",
+    "Accept-Encoding": "gzip",
 }
 
+# Compares greater than any timestamp string, which keeps records without a
+# display time at the head of the descending sort.
+_MISSING_TIME_KEY = "\U0010ffff"
 
-def _utc_now() -> str:
-    """Return the current UTC timestamp in ISO-8601 format."""
-    return datetime.utcnow().replace(tzinfo=timezone.utc).isoformat().replace("+00:00", "Z")
+# Shared read-only stand-in for missing nested objects such as ``exit_plan``.
+_EMPTY: Mapping[str, Any] = MappingProxyType({})
 
+_GET_MODEL_ID = itemgetter("model_id")
+_GET_SYMBOL = itemgetter("symbol")
+_GET_STATUS = itemgetter("status")
+
+_CACHE_TTLS = {
+    "/trades": TTL_TRADES,
+    "/positions": TTL_POSITIONS,
+    "/account-totals": TTL_TOTALS,
+}
+
+# Warm Vercel containers keep module state between invocations, so upstream
+# payloads are cached per path as ``(expires_at, payload)`` tuples. Expired
+# entries are kept around as a fallback for when the upstream fails.
+_CACHE: Dict[str, tuple[float, Any]] = {}
+_CACHE_LOCKS: Dict[str, threading.Lock] = {}
+# ``(failed_at, exception)`` of the last failed refresh per path, so callers
+# queued behind that refresh reuse its outcome instead of retrying upstream.
+_CACHE_FAILURES: Dict[str, tuple[float, Exception]] = {}
+
+# LRU of normalised closed trades keyed by trade id, storing the raw
+# ``exit_time`` alongside so a changed upstream record is re-normalised.
+_NORM_TRADE_CACHE_SIZE = 2048
+_NORM_TRADE_CACHE: OrderedDict[str, tuple[Any, Dict[str, Any]]] = OrderedDict()
+
+# Worker threads for the concurrent upstream fetches. Like the connection
+# pool, they outlive a single invocation in a warm container.
+_EXECUTOR = ThreadPoolExecutor(max_workers=3, thread_name_prefix="nof1-fetch")
+
+# ``(monotonic_time, iso_string)`` of the last ``_utc_now`` call.
+_LAST_NOW: tuple[float, str] = (float("-inf"), "")
+
+# All upstream calls target the same host, so a module-level keep-alive pool
+# lets warm invocations skip the TCP and TLS handshakes. Like ``urlopen`` it
+# follows redirects but never retries a failed request.
+_POOL = (
+    urllib3.PoolManager(
+        num_pools=2,
+        maxsize=4,
+        retries=urllib3.Retry(connect=0, read=0, status=0, other=0, redirect=10),
+        headers=HEADERS,
+    )
+    if urllib3 is not None
+    else None
+)
+
+
+def _utc_now() -> str:
+    """Return the current UTC timestamp in ISO-8601 format.
+
+    Sub-second precision is irrelevant for ``fetched_at`` and the display-time
+    fallback, so the formatted value is reused for up to half a second.
+    """
+    global _LAST_NOW  # pylint: disable=global-statement
+    now = time.monotonic()
+    cached_at, cached = _LAST_NOW
+    if now - cached_at < 0.5:
+        return cached
+    stamp = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+    _LAST_NOW = (now, stamp)
+    return stamp
+
+
+def _read_body(url: str) -> bytes:
+    """Download ``url``, preferring the pooled keep-alive connection."""
+    if _POOL is not None:
+        try:
+            response = _POOL.request("GET", url, timeout=30, decode_content=True)
+        except urllib3.exceptions.HTTPError as err:
+            raise RuntimeError(f"Failed to reach NOF1 API: {err}") from err
+        if response.status >= 300:
+            raise RuntimeError(f"HTTP {response.status} {response.reason}")
+        return response.data
 
-def _fetch_json(path: str) -> Dict[str, Any]:
-    """Fetch JSON data from the NOF1 API."""
-    url = f"{BASE_URL}{path}"
     request = urllib.request.Request(url, headers=HEADERS, method="GET")
     try:
         with urllib.request.urlopen(request, timeout=30) as response:
-            body = response.read().decode("utf-8")
+            body = response.read()
+            if response.headers.get("Content-Encoding") == "gzip":
+                body = gzip.decompress(body)
+            return body
     except urllib.error.HTTPError as err:
         raise RuntimeError(f"HTTP {err.code} {err.reason}") from err
     except urllib.error.URLError as err:
         raise RuntimeError(f"Failed to reach NOF1 API: {err.reason}") from err
 
+
+def _request_json(path: str) -> Dict[str, Any]:
+    """Fetch JSON data from the NOF1 API."""
+    body = _read_body(f"{BASE_URL}{path}")
+
     try:
-        payload = json.loads(body)
+        payload = _loads(body)
     except json.JSONDecodeError as exc:
         raise RuntimeError(f"Invalid JSON from NOF1 API: {exc}") from exc
     return payload
 
 
+def _fetch_json(path: str, stale_paths: List[str] | None = None) -> Dict[str, Any]:
+    """Fetch JSON data through the in-memory TTL cache.
+
+    When the upstream request fails and a previous payload exists, the stale
+    payload is returned instead and ``path`` is appended to ``stale_paths``.
+    Concurrent misses for the same path share a single upstream request.
+    """
+    cached = _CACHE.get(path)
+    if cached is not None and cached[0] > time.monotonic():
+        return cached[1]
+
+    waiting_since = time.monotonic()
+    with _CACHE_LOCKS.setdefault(path, threading.Lock()):
+        # Another thread may have refreshed the entry while this one waited.
+        now = time.monotonic()
+        cached = _CACHE.get(path)
+        if cached is not None and cached[0] > now:
+            return cached[1]
+
+        failure = _CACHE_FAILURES.get(path)
+        if failure is not None and failure[0] >= waiting_since:
+            # The refresh this thread queued behind has just failed; share its
+            # outcome rather than hitting the upstream again.
+            exc = failure[1]
+        else:
+            try:
+                payload = _request_json(path)
+            except Exception as err:  # pylint: disable=broad-except
+                exc = err
+                _CACHE_FAILURES[path] = (time.monotonic(), exc)
+            else:
+                _CACHE_FAILURES.pop(path, None)
+                ttl = _CACHE_TTLS.get(path.partition("?")[0], 0.0)
+                _CACHE[path] = (now + ttl, payload)
+                return payload
+
+        if cached is None:
+            raise exc
+        print(f"[latest_trades] serving stale {path} -> {exc}", flush=True)
+        if stale_paths is not None:
+            stale_paths.append(path)
+        return cached[1]
+
+
 def _coerce_float(value: Any) -> float | None:
+    # Upstream fields are usually numbers already; skip the try/except for them.
+    value_type = type(value)
+    if value_type is float:
+        return value
+    if value_type is int:
+        return float(value)
+    if value is None:
+        return None
+    if value_type is str:
+        return _float_from_str(value)
     try:
         return float(value)
     except (TypeError, ValueError):
         return None
 
 
-def _ensure_iso8601(value: Any) -> str | None:
-    """Best-effort conversion to ISO-8601 (UTC)."""
-    if value is None:
+@lru_cache(maxsize=4096)
+def _float_from_str(value: str) -> float | None:
+    """Parse a numeric string, memoised because prices and labels repeat."""
+    try:
+        return float(value)
+    except ValueError:
         return None
 
-    epoch_seconds: float | None = None
 
-    if isinstance(value, (int, float)):
-        epoch_seconds = float(value)
-    elif isinstance(value, str):
-        candidate = value.strip()
-        if not candidate:
-            return None
-        try:
-            # Numeric strings (seconds or milliseconds)
-            epoch_seconds = float(candidate)
-        except ValueError:
-            normalized = candidate.replace("Z", "+00:00")
-            normalized = normalized.replace(" ", "T", 1)
-            try:
-                dt_obj = datetime.fromisoformat(normalized)
-                if dt_obj.tzinfo is None:
-                    dt_obj = dt_obj.replace(tzinfo=timezone.utc)
-                return dt_obj.astimezone(timezone.utc).isoformat().replace("+00:00", "Z")
-            except ValueError:
-                return candidate
-
-    if epoch_seconds is None:
-        return None
+def _is_canonical_iso(value: str) -> bool:
+    """Return True for ``YYYY-MM-DDTHH:MM:SS[.ffffff]Z`` strings, which convert to themselves."""
+    length = len(value)
+    if length == 27:
+        if value[19] != "." or value[20:26] == "000000":
+            return False
+    elif length != 20:
+        return False
+    # The leading-digit check keeps padded input on the strip() path, and
+    # isascii() keeps out non-ASCII digits that fromisoformat would rewrite.
+    return (
+        value[-1] == "Z"
+        and value[0].isdigit()
+        and value[10] == "T"
+        and value[4] == "-"
+        and value[7] == "-"
+        and value[13] == ":"
+        and value[16] == ":"
+        and value.isascii()
+    )
 
+
+@lru_cache(maxsize=4096)
+def _iso_from_num(epoch_seconds: float) -> str:
+    """Convert epoch seconds (or milliseconds) to ISO-8601 (UTC)."""
     if epoch_seconds > 1e12:  # treat as milliseconds
         epoch_seconds /= 1000.0
 
@@ -97,19 +272,66 @@ def _ensure_iso8601(value: Any) -> str | None:
     return dt_obj.isoformat().replace("+00:00", "Z")
 
 
+@lru_cache(maxsize=4096)
+def _iso_from_str(value: str) -> str | None:
+    """Convert a timestamp string to ISO-8601 (UTC), keeping unparseable input."""
+    candidate = value.strip()
+    if not candidate:
+        return None
+    try:
+        # Numeric strings (seconds or milliseconds)
+        epoch_seconds = float(candidate)
+    except ValueError:
+        normalized = candidate.replace("Z", "+00:00")
+        normalized = normalized.replace(" ", "T", 1)
+        try:
+            dt_obj = datetime.fromisoformat(normalized)
+            if dt_obj.tzinfo is None:
+                dt_obj = dt_obj.replace(tzinfo=timezone.utc)
+            elif dt_obj.utcoffset():
+                dt_obj = dt_obj.astimezone(timezone.utc)
+            return dt_obj.isoformat().replace("+00:00", "Z")
+        except ValueError:
+            return candidate
+    return _iso_from_num(epoch_seconds)
+
+
+def _ensure_iso8601(value: Any) -> str | None:
+    """Best-effort conversion to ISO-8601 (UTC).
+
+    Timestamps repeat heavily across a payload, so the conversions are
+    memoised per raw value.
+    """
+    if isinstance(value, str):
+        if _is_canonical_iso(value):
+            return value
+        return _iso_from_str(value)
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return _iso_from_num(float(value))
+    return None
+
+
 def _normalize_trade(trade: Dict[str, Any]) -> Dict[str, Any]:
     """Extract the fields needed by the frontend and normalise names."""
+    trade_id = str(trade.get("trade_id") or trade.get("id") or "")
+    exit_time_raw = trade.get("exit_time")
+    if trade_id and exit_time_raw is not None:
+        cached = _NORM_TRADE_CACHE.get(trade_id)
+        if cached is not None and cached[0] == exit_time_raw:
+            _NORM_TRADE_CACHE.move_to_end(trade_id)
+            return cached[1]
+
     entry_time_raw = trade.get("entry_time")
     entry_label = trade.get("entry_human_time") or entry_time_raw
-    exit_time_raw = trade.get("exit_time")
     exit_label = trade.get("exit_human_time") or exit_time_raw
     entry_time = _ensure_iso8601(entry_time_raw)
     exit_time = _ensure_iso8601(exit_time_raw)
     leverage = trade.get("leverage")
     leverage_value = _coerce_float(leverage)
+    exit_plan = trade.get("exit_plan") or _EMPTY
 
-    return {
-        "id": str(trade.get("trade_id") or trade.get("id") or ""),
+    normalised = {
+        "id": trade_id,
         "model_id": trade.get("model_id"),
         "symbol": trade.get("symbol"),
         "side": trade.get("side"),
@@ -118,8 +340,8 @@ def _normalize_trade(trade: Dict[str, Any]) -> Dict[str, Any]:
         "quantity": trade.get("quantity"),
         "entry_price": _coerce_float(trade.get("entry_price")),
         "exit_price": _coerce_float(trade.get("exit_price")),
-        "profit_target": _coerce_float((trade.get("exit_plan") or {}).get("profit_target")),
-        "stop_loss": _coerce_float((trade.get("exit_plan") or {}).get("stop_loss")),
+        "profit_target": _coerce_float(exit_plan.get("profit_target")),
+        "stop_loss": _coerce_float(exit_plan.get("stop_loss")),
         "entry_human_time": entry_label,
         "exit_human_time": exit_label,
         "entry_time": entry_time,
@@ -133,30 +355,53 @@ def _normalize_trade(trade: Dict[str, Any]) -> Dict[str, Any]:
         "event": "trade_closed" if exit_time else "trade_record",
     }
 
-
-def _normalize_position(position: Dict[str, Any]) -> Dict[str, Any]:
-    """Normalise live positions to align with the trade schema."""
-    timestamp_hint = position.pop("_account_timestamp", None)
+    # Closed trades no longer change, so their normalised form is reusable.
+    if trade_id and exit_time:
+        _NORM_TRADE_CACHE[trade_id] = (exit_time_raw, normalised)
+        if len(_NORM_TRADE_CACHE) > _NORM_TRADE_CACHE_SIZE:
+            _NORM_TRADE_CACHE.popitem(last=False)
+    return normalised
+
+
+def _normalize_position(
+    position: Dict[str, Any],
+    *,
+    symbol_default: Any = None,
+    model_default: Any = None,
+    timestamp_hint: Any = None,
+) -> Dict[str, Any]:
+    """Normalise live positions to align with the trade schema.
+
+    The keyword defaults fill in fields that account-total entries carry
+    outside the position itself.
+    """
+    model_id = position.get("model_id", model_default)
+    symbol = position.get("symbol", symbol_default)
     entry_time_raw = position.get("entry_time") or timestamp_hint
     entry_label = position.get("entry_human_time") or entry_time_raw
     entry_time = _ensure_iso8601(entry_time_raw)
     leverage = position.get("leverage")
     leverage_value = _coerce_float(leverage)
-    exit_plan = position.get("exit_plan") or {}
+    exit_plan = position.get("exit_plan") or _EMPTY
 
     identifier = (
         position.get("position_id")
         or position.get("id")
         or position.get("entry_oid")
-        or f"{position.get('model_id')}-{position.get('symbol')}-{entry_time or entry_label or ''}"
+        or f"{model_id}-{symbol}-{entry_time or entry_label or ''}"
     )
 
-    display_time = entry_time or _ensure_iso8601(timestamp_hint) or _utc_now()
+    display_time = entry_time
+    # Only parse the hint if entry_time_raw did not already fall back to it.
+    if not display_time and entry_time_raw is not timestamp_hint:
+        display_time = _ensure_iso8601(timestamp_hint)
+    if not display_time:
+        display_time = _utc_now()
 
     return {
         "id": str(identifier),
-        "model_id": position.get("model_id"),
-        "symbol": position.get("symbol"),
+        "model_id": model_id,
+        "symbol": symbol,
         "side": position.get("side"),
         "leverage": leverage_value,
         "raw_leverage": leverage,
@@ -179,16 +424,10 @@ def _normalize_position(position: Dict[str, Any]) -> Dict[str, Any]:
     }
 
 
-def _sort_trades(trades: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-    """Sort trades by entry_time descending."""
-
-    def sort_key(trade: Dict[str, Any]) -> tuple[int, str]:
-        entry = trade.get("display_time")
-        if isinstance(entry, str):
-            return (0, entry)
-        return (1, "")
-
-    return sorted(trades, key=sort_key, reverse=True)
+def _display_time_key(trade: Dict[str, Any]) -> str:
+    """Sort key for ``display_time``; records without one sort above all others."""
+    entry = trade.get("display_time")
+    return entry if isinstance(entry, str) else _MISSING_TIME_KEY
 
 
 def _normalize_account(entry: Dict[str, Any]) -> Dict[str, Any]:
@@ -216,20 +455,21 @@ def _extract_positions_from_account_entry(entry: Dict[str, Any]) -> List[Dict[st
     for symbol, pos in positions_map.items():
         if not isinstance(pos, dict):
             continue
-        pos_copy = pos.copy()
-        pos_copy.setdefault("symbol", symbol)
-        pos_copy.setdefault("model_id", model_id)
-        if timestamp is not None:
-            pos_copy.setdefault("_account_timestamp", timestamp)
-        positions.append(_normalize_position(pos_copy))
+        positions.append(
+            _normalize_position(
+                pos, symbol_default=symbol, model_default=model_id, timestamp_hint=timestamp
+            )
+        )
     return positions
 
 
-def _collect_account_data() -> tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+def _collect_account_data(
+    totals_future: Future[Dict[str, Any]],
+) -> tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
     accounts: List[Dict[str, Any]] = []
     positions: List[Dict[str, Any]] = []
     try:
-        payload = _fetch_json("/account-totals")
+        payload = totals_future.result()
         entries = payload.get("accountTotals") or payload.get("accounts") or payload
         if isinstance(entries, list):
             for entry in entries:
@@ -242,13 +482,16 @@ def _collect_account_data() -> tuple[List[Dict[str, Any]], List[Dict[str, Any]]]
     return accounts, positions
 
 
-def _collect_open_positions() -> tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
-    """Fetch open positions from primary endpoint with account-total fallbacks."""
+def _collect_open_positions(
+    positions_future: Future[Dict[str, Any]],
+    totals_future: Future[Dict[str, Any]],
+) -> tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """Collect open positions from the primary endpoint with account-total fallbacks."""
     errors: List[str] = []
     positions_by_id: Dict[str, Dict[str, Any]] = {}
 
     try:
-        positions_payload = _fetch_json(f"/positions?limit={POSITIONS_LIMIT}")
+        positions_payload = positions_future.result()
         positions_raw = (
             positions_payload.get("positions")
             or positions_payload.get("data")
@@ -267,7 +510,7 @@ def _collect_open_positions() -> tuple[List[Dict[str, Any]], List[Dict[str, Any]
     except Exception as exc:  # pylint: disable-broad-except
         errors.append(f"/positions -> {exc}")
 
-    accounts, fallback_positions = _collect_account_data()
+    accounts, fallback_positions = _collect_account_data(totals_future)
     for pos in fallback_positions:
         identifier = pos.get("id")
         if identifier and identifier not in positions_by_id:
@@ -276,8 +519,10 @@ def _collect_open_positions() -> tuple[List[Dict[str, Any]], List[Dict[str, Any]
     if errors:
         print(f"[latest_trades] open position fetch issues -> {' | '.join(errors)}", flush=True)
 
-    sorted_positions = _sort_trades(list(positions_by_id.values()))
-    return sorted_positions[: max(POSITIONS_LIMIT, 1)], accounts
+    top_positions = heapq.nlargest(
+        max(POSITIONS_LIMIT, 1), positions_by_id.values(), key=_display_time_key
+    )
+    return top_positions, accounts
 
 
 class handler(BaseHTTPRequestHandler):
@@ -289,65 +534,94 @@ class handler(BaseHTTPRequestHandler):
         self._send_response(HTTPStatus.NO_CONTENT, b"")
 
     def do_GET(self) -> None:  # noqa: N802
-        parsed = urlparse(self.path or "")
-        query_params = parse_qs(parsed.query or "")
-        limit_param = query_params.get("limit", [None])[0]
-
-        try:
-            limit = int(limit_param) if limit_param is not None else DEFAULT_LIMIT
-        except (TypeError, ValueError):
-            limit = DEFAULT_LIMIT
-
+        # ``limit`` is the only query parameter, so scan for it directly.
+        query = (self.path or "").partition("?")[2]
+        limit = DEFAULT_LIMIT
+        for pair in query.split("&"):
+            if pair.startswith("limit="):
+                try:
+                    limit = int(pair[6:])
+                except ValueError:
+                    pass
+                break
+
+        stale_paths: List[str] = []
         try:
-            payload = _fetch_json("/trades")
+            # The upstream endpoints are independent, so fetch them concurrently.
+            trades_future = _EXECUTOR.submit(_fetch_json, "/trades", stale_paths)
+            positions_future = _EXECUTOR.submit(
+                _fetch_json, f"/positions?limit={POSITIONS_LIMIT}", stale_paths
+            )
+            totals_future = _EXECUTOR.submit(_fetch_json, "/account-totals", stale_paths)
+            payload = trades_future.result()
             trades_raw = payload.get("trades")
             if not isinstance(trades_raw, list):
                 raise RuntimeError("Unexpected response shape from /trades")
-            normalised_trades = [_normalize_trade(tr) for tr in trades_raw if isinstance(tr, dict)]
-            filtered_trades = [tr for tr in normalised_trades if tr["id"]]
-            sorted_trades = _sort_trades(filtered_trades)
-            limited_trades = sorted_trades[: max(limit, 1)]
-
-            open_positions, accounts = _collect_open_positions()
-
-            combined = limited_trades + open_positions
-            combined_sorted = _sort_trades(combined)
-
-            models = sorted({item["model_id"] for item in combined_sorted if item.get("model_id")})
-            symbols = sorted({item["symbol"] for item in combined_sorted if item.get("symbol")})
-            open_count = sum(1 for item in combined_sorted if item.get("status") == "open")
-            closed_count = sum(1 for item in combined_sorted if item.get("status") != "open")
-
-            response_body = {
-                "fetched_at": _utc_now(),
-                "limit": limit,
-                "count": len(combined_sorted),
-                "open_count": open_count,
-                "closed_count": closed_count,
-                "trades": combined_sorted,
-                "models": models,
-                "symbols": symbols,
-                "accounts": accounts,
-            }
-            body_bytes = json.dumps(response_body).encode("utf-8")
-            self._send_response(HTTPStatus.OK, body_bytes)
+            filtered_trades = [
+                normalised
+                for tr in trades_raw
+                if isinstance(tr, dict) and (normalised := _normalize_trade(tr))["id"]
+            ]
+            limited_trades = heapq.nlargest(
+                max(limit, 1), filtered_trades, key=_display_time_key
+            )
+
+            open_positions, accounts = _collect_open_positions(positions_future, totals_future)
+
+            # Both halves are already in display-time order, so a linear merge
+            # replaces a full re-sort of the combined list.
+            combined_sorted = list(
+                heapq.merge(limited_trades, open_positions, key=_display_time_key, reverse=True)
+            )
+
+            # Every normalised record carries these keys, so the aggregates can
+            # be pulled out as flat columns without per-item bytecode.
+            models = sorted(filter(None, set(map(_GET_MODEL_ID, combined_sorted))))
+            symbols = sorted(filter(None, set(map(_GET_SYMBOL, combined_sorted))))
+            open_count = list(map(_GET_STATUS, combined_sorted)).count("open")
+            closed_count = len(combined_sorted) - open_count
+
+            body_bytes = _dumps(
+                {
+                    "fetched_at": _utc_now(),
+                    "limit": limit,
+                    "count": len(combined_sorted),
+                    "open_count": open_count,
+                    "closed_count": closed_count,
+                    "trades": combined_sorted,
+                    "models": models,
+                    "symbols": symbols,
+                    "accounts": accounts,
+                }
+            )
+            extra_headers = {STALE_HEADER: ", ".join(stale_paths)} if stale_paths else None
+            self._send_response(HTTPStatus.OK, body_bytes, extra_headers)
         except Exception as exc:  # pylint: disable=broad-except
             error_message = f"{exc.__class__.__name__}: {exc}"
             print(f"[latest_trades] error -> {error_message}", flush=True)
-            body_bytes = json.dumps({"error": error_message}).encode("utf-8")
+            body_bytes = _dumps({"error": error_message})
             self._send_response(HTTPStatus.BAD_GATEWAY, body_bytes)
 
     def log_message(self, fmt: str, *args: object) -> None:  # noqa: D401, ANN001
         """Silence the default logging (Vercel already captures stdout)."""
         return
 
-    def _send_response(self, status: HTTPStatus, body: bytes) -> None:
+    def _send_response(
+        self,
+        status: HTTPStatus,
+        body: bytes,
+        extra_headers: Dict[str, str] | None = None,
+    ) -> None:
         self.send_response(status.value)
-        self.send_header("Content-Type", "application/json; charset=utf-8")
-        self.send_header("Cache-Control", "no-store, max-age=0")
-        self.send_header("Access-Control-Allow-Origin", "*")
-        self.send_header("Access-Control-Allow-Methods", "GET, OPTIONS")
-        self.send_header("Access-Control-Allow-Headers", "Content-Type, Authorization")
-        self.end_headers()
+        self.flush_headers()
+        header_lines = [_FIXED_HEADERS]
+        # RFC 9110 forbids Content-Length on 204 responses.
+        if status is not HTTPStatus.NO_CONTENT:
+            header_lines.append(b"Content-Length: %d\r\n" % len(body))
+        if extra_headers:
+            for name, value in extra_headers.items():
+                header_lines.append(f"{name}: {value}\r\n".encode("latin-1"))
+        header_lines.append(b"\r\n")
+        self.wfile.write(b"".join(header_lines))
         if body:
             self.wfile.write(body)
@@ -1,35 +1,46 @@
-import copy
+import asyncio
 import json
 import os
-import threading
 import time
-import urllib.error
-import urllib.request
+from contextlib import suppress
 from datetime import datetime, timezone
+from itertools import islice
 from typing import Any, Dict, List
 
+import httpx
 from fastapi import FastAPI, HTTPException
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - fall back to the stdlib codec
+    orjson = None
+
+_json_loads = orjson.loads if orjson is not None else json.loads
+_ResponseClass = ORJSONResponse if orjson is not None else JSONResponse
+
 
 def utc_now_iso() -> str:
     """Return current UTC time in ISO-8601 format with a Z suffix."""
-    return datetime.utcnow().replace(tzinfo=timezone.utc).isoformat().replace("+00:00", "Z")
+    return datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
 
 
 class TradePoller:
-    """Background worker that polls NOF1 trades and captures deltas."""
+    """Background task that polls NOF1 trades and captures deltas.
+
+    The poller runs on the application's event loop, so its state is only
+    touched from that loop and needs no locking.
+    """
 
     def __init__(self, base_url: str, interval_seconds: float, cache_limit: int) -> None:
         self.base_url = base_url.rstrip("/")
         self.interval_seconds = max(interval_seconds, 10.0)
         self.cache_limit = max(cache_limit, 1)
 
-        self._lock = threading.Lock()
-        self._stop_event = threading.Event()
-        self._thread: threading.Thread | None = None
+        self._task: asyncio.Task[None] | None = None
+        self._http: httpx.AsyncClient | None = None
 
         self._initialized = False
         self._known_trade_ids: set[str] = set()
@@ -39,6 +50,11 @@ class TradePoller:
         self._last_poll_completed: str | None = None
         self._last_error: str | None = None
 
+        # Readers share one snapshot per state change, and concurrent poll
+        # requests join the poll already in flight instead of re-fetching.
+        self._snapshot_cache: Dict[str, Any] | None = None
+        self._inflight_poll: asyncio.Task[None] | None = None
+
     @property
     def headers(self) -> Dict[str, str]:
         return {
@@ -47,101 +63,125 @@ class TradePoller:
         }
 
     def start(self) -> None:
-        if self._thread and self._thread.is_alive():
+        if self._task and not self._task.done():
             return
-        self._stop_event.clear()
-        self._thread = threading.Thread(target=self._run_loop, name="TradePoller", daemon=True)
-        self._thread.start()
+        self._task = asyncio.create_task(self._run_loop(), name="TradePoller")
 
-    def stop(self) -> None:
-        self._stop_event.set()
-        if self._thread:
-            self._thread.join(timeout=5)
+    async def stop(self) -> None:
+        try:
+            for task in (self._task, self._inflight_poll):
+                if task and not task.done():
+                    task.cancel()
+                    # A failed poll has already been reported to its callers.
+                    with suppress(asyncio.CancelledError, Exception):
+                        await task
+        finally:
+            self._task = None
+            self._inflight_poll = None
+            if self._http:
+                await self._http.aclose()
+                self._http = None
 
     def snapshot(self) -> Dict[str, Any]:
-        with self._lock:
-            return {
+        """Return the current state; the same object is shared until it changes."""
+        # Trade summaries are built once per poll and never mutated afterwards,
+        # so a shallow copy of the lists is enough to hand out a stable view.
+        if self._snapshot_cache is None:
+            self._snapshot_cache = {
                 "initialized": self._initialized,
                 "poll_interval_seconds": self.interval_seconds,
                 "last_poll_started": self._last_poll_started,
                 "last_poll_completed": self._last_poll_completed,
                 "last_error": self._last_error,
-                "recent_trades": copy.deepcopy(self._recent_trades),
-                "new_trades": copy.deepcopy(self._new_trades),
+                "recent_trades": self._recent_trades[:],
+                "new_trades": self._new_trades[:],
             }
+        return self._snapshot_cache
 
-    def trigger_once(self) -> Dict[str, Any]:
+    async def trigger_once(self) -> Dict[str, Any]:
         try:
-            self._poll_once()
+            await self._poll_shared()
         except Exception as exc:  # pylint: disable=broad-except
             raise HTTPException(status_code=502, detail=str(exc)) from exc
         return self.snapshot()
 
-    def _run_loop(self) -> None:
-        while not self._stop_event.is_set():
+    async def _run_loop(self) -> None:
+        while True:
             start_time = time.monotonic()
             try:
-                self._poll_once()
+                await self._poll_shared()
             except Exception as exc:  # pylint: disable=broad-except
-                with self._lock:
-                    self._last_error = str(exc)
-                    self._last_poll_completed = utc_now_iso()
+                self._last_error = str(exc)
+                self._last_poll_completed = utc_now_iso()
+                self._snapshot_cache = None
             elapsed = time.monotonic() - start_time
-            wait_seconds = max(self.interval_seconds - elapsed, 1.0)
-            if self._stop_event.wait(wait_seconds):
-                break
+            await asyncio.sleep(max(self.interval_seconds - elapsed, 1.0))
+
+    async def _poll_shared(self) -> None:
+        """Run a poll, or wait for the one that is already running."""
+        if self._inflight_poll is None or self._inflight_poll.done():
+            self._inflight_poll = asyncio.create_task(self._poll_once())
+        # Shield the shared poll so one cancelled caller does not abort it for the rest.
+        await asyncio.shield(self._inflight_poll)
 
-    def _poll_once(self) -> None:
-        started_at = utc_now_iso()
-        with self._lock:
-            self._last_poll_started = started_at
+    async def _poll_once(self) -> None:
+        self._last_poll_started = utc_now_iso()
+        self._snapshot_cache = None
 
         url = f"{self.base_url}/trades"
-        text = self._fetch(url)
-        payload = json.loads(text)
+        body = await self._fetch(url)
+        payload = _json_loads(body)
 
         trades = payload.get("trades")
         if not isinstance(trades, list):
             raise ValueError("Unexpected trades payload shape")
 
-        summaries = []
-        incoming_ids: list[str] = []
-        new_trades: list[dict[str, Any]] = []
-
+        summaries_by_id: Dict[str, Dict[str, Any]] = {}
         for trade in trades:
             if not isinstance(trade, dict):
                 continue
             trade_id = str(trade.get("id") or trade.get("trade_id") or "")
-            if not trade_id:
+            if not trade_id or trade_id in summaries_by_id:
                 continue
-            incoming_ids.append(trade_id)
-            summary = self._summarize_trade(trade)
-            summaries.append(summary)
-            if self._initialized and trade_id not in self._known_trade_ids:
-                new_trades.append(summary)
+            summaries_by_id[trade_id] = self._summarize_trade(trade)
+
+        if self._initialized:
+            known_ids = self._known_trade_ids
+            new_trades = [
+                summary for trade_id, summary in summaries_by_id.items() if trade_id not in known_ids
+            ]
+        else:
+            new_trades = []
 
-        trimmed = summaries[: self.cache_limit]
+        trimmed = list(islice(summaries_by_id.values(), self.cache_limit))
         limited_new_trades = new_trades[: self.cache_limit]
 
-        completed_at = utc_now_iso()
-        with self._lock:
-            self._recent_trades = trimmed
-            self._new_trades = limited_new_trades
-            self._known_trade_ids = set(incoming_ids)
-            self._initialized = True
-            self._last_poll_completed = completed_at
-            self._last_error = None
-
-    def _fetch(self, url: str) -> str:
-        request = urllib.request.Request(url, headers=self.headers, method="GET")
+        self._recent_trades = trimmed
+        self._new_trades = limited_new_trades
+        self._known_trade_ids = set(summaries_by_id)
+        self._initialized = True
+        self._last_poll_completed = utc_now_iso()
+        self._last_error = None
+        self._snapshot_cache = None
+
+    async def _fetch(self, url: str) -> bytes:
+        if self._http is None:
+            # Shared keep-alive client so successive polls reuse the connection.
+            self._http = httpx.AsyncClient(
+                headers=self.headers,
+                timeout=30,
+                follow_redirects=True,
+                transport=httpx.AsyncHTTPTransport(retries=3),
+            )
         try:
-            with urllib.request.urlopen(request, timeout=30) as response:
-                body = response.read()
-                return body.decode("utf-8")
-        except urllib.error.HTTPError as err:
-            raise RuntimeError(f"HTTP error {err.code} {err.reason} for {url}") from err
-        except urllib.error.URLError as err:
-            raise RuntimeError(f"Failed to reach {url}: {err.reason}") from err
+            response = await self._http.get(url)
+        except httpx.HTTPError as err:
+            raise RuntimeError(f"Failed to reach {url}: {err}") from err
+        if response.status_code >= 300:
+            raise RuntimeError(
+                f"HTTP error {response.status_code} {response.reason_phrase} for {url}"
+            )
+        return response.content
 
     @staticmethod
     def _summarize_trade(trade: Dict[str, Any]) -> Dict[str, Any]:
@@ -172,22 +212,22 @@ def create_app() -> FastAPI:
     poller = TradePoller(base_url=base_url, interval_seconds=interval_seconds, cache_limit=cache_limit)
 
     @app.on_event("startup")
-    def _startup() -> None:
+    async def _startup() -> None:
         poller.start()
 
     @app.on_event("shutdown")
-    def _shutdown() -> None:
-        poller.stop()
+    async def _shutdown() -> None:
+        await poller.stop()
 
     @app.get("/api/trades/latest")
-    def get_latest_trades() -> JSONResponse:
+    async def get_latest_trades() -> JSONResponse:
         snapshot = poller.snapshot()
-        return JSONResponse(snapshot)
+        return _ResponseClass(snapshot)
 
     @app.post("/api/trades/poll")
-    def trigger_poll() -> JSONResponse:
-        snapshot = poller.trigger_once()
-        return JSONResponse(snapshot)
+    async def trigger_poll() -> JSONResponse:
+        snapshot = await poller.trigger_once()
+        return _ResponseClass(snapshot)
 
     frontend_dir = Path(__file__).resolve().parents[1] / "frontend"
     if frontend_dir.exists():
@@ -12,11 +12,26 @@ Usage:
 from __future__ import annotations
 
 import datetime as dt
+import gzip
+import hashlib
 import json
+import os
 import pathlib
+import shutil
 import sys
 import urllib.error
 import urllib.request
+from concurrent.futures import ThreadPoolExecutor, wait
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - fall back to the stdlib parser
+    orjson = None
+
+try:
+    import urllib3
+except ImportError:  # pragma: no cover - fall back to urllib.request
+    urllib3 = None
 
 BASE_URL = "https://nof1.ai/api"
 
@@ -34,36 +49,337 @@ ENDPOINTS = [
     {"key": "conversations", "paths": ["/conversations"]},
 ]
 
+# Resolve every endpoint's candidate URLs once, in preference order.
+ENDPOINT_URLS = [
+    (sys.intern(endpoint["key"]), tuple(BASE_URL + path for path in endpoint["paths"]))
+    for endpoint in ENDPOINTS
+]
+
 HEADERS = {
     "Accept": "application/json",
+    "Accept-Encoding": "gzip",
     "User-Agent": "nof1-snapshot/1.0 (+https://nof1.ai)",
 }
 
+# Every endpoint lives on the same host, so the workers share one keep-alive
+# pool instead of paying a TCP and TLS handshake per request. Like urlopen it
+# follows redirects but never retries a failed request.
+POOL = (
+    urllib3.PoolManager(
+        maxsize=sum(len(urls) for _, urls in ENDPOINT_URLS),
+        headers=HEADERS,
+        retries=urllib3.Retry(connect=0, read=0, status=0, other=0, redirect=10),
+    )
+    if urllib3 is not None
+    else None
+)
+
+# Seconds the preferred path gets before its fallback is requested alongside it.
+FALLBACK_DELAY = 2.0
+
+# Bodies are streamed to disk in fixed-size chunks through a large write
+# buffer, so memory stays flat however big a payload gets.
+COPY_CHUNK_SIZE = 64 * 1024
+WRITE_BUFFER_SIZE = 1024 * 1024
+
+# Opt-in gzip storage for the saved payloads; level 1 keeps most of the size
+# win for a fraction of the CPU of the default level.
+GZIP_SNAPSHOTS = os.environ.get("NOF1_SNAPSHOT_GZIP", "").lower() in {"1", "true", "yes"}
+SNAPSHOT_SUFFIX = ".json.gz" if GZIP_SNAPSHOTS else ".json"
+
+# Log lines carrying this prefix are routed to stderr.
+WARNING_PREFIX = "Warning: "
+
+# Payloads are only parsed to validate them, so use the fastest parser around.
+json_loads = orjson.loads if orjson is not None else json.loads
+
 
 def timestamp_parts(now: dt.datetime | None = None) -> tuple[str, str, str]:
     """Return ISO8601 timestamp plus date and compact time components."""
     if now is None:
-        now = dt.datetime.utcnow().replace(tzinfo=dt.timezone.utc)
-    iso = now.isoformat().replace("+00:00", "Z")
+        now = dt.datetime.now(dt.timezone.utc)
+    iso = now.strftime("%Y-%m-%dT%H:%M:%S.%fZ")
     date_part = now.strftime("%Y-%m-%d")
     time_part = now.strftime("%H%M%SZ")
     return iso, date_part, time_part
 
 
-def fetch(url: str) -> str:
-    """Fetch UTF-8 text from URL, raising on HTTP errors."""
-    request = urllib.request.Request(url, headers=HEADERS, method="GET")
-    with urllib.request.urlopen(request, timeout=30) as response:
-        body = response.read()
-        return body.decode("utf-8")
+def load_previous_validators(
+    root: pathlib.Path, snapshot_dir: pathlib.Path
+) -> dict[str, dict[str, object]]:
+    """Return the newest earlier manifest's entries that carry cache validators."""
+    for index_path in sorted((root / "snapshots" / "nof1").glob("*/*/index.json"), reverse=True):
+        if index_path.parent == snapshot_dir:
+            continue
+        try:
+            previous = json_loads(index_path.read_bytes())
+        except (OSError, ValueError):
+            continue
+        return {
+            entry["key"]: entry
+            for entry in previous.get("files", [])
+            if "path" in entry and ("etag" in entry or "last_modified" in entry)
+        }
+    return {}
+
+
+def conditional_headers(previous: dict[str, object] | None) -> dict[str, str]:
+    """Build If-None-Match/If-Modified-Since headers from a previous manifest entry."""
+    if not previous:
+        return {}
+    headers = {}
+    if previous.get("etag"):
+        headers["If-None-Match"] = previous["etag"]
+    if previous.get("last_modified"):
+        headers["If-Modified-Since"] = previous["last_modified"]
+    return headers
+
+
+def response_validators(headers) -> dict[str, str]:
+    """Extract ETag/Last-Modified from response headers as manifest fields."""
+    validators = {}
+    if headers.get("ETag"):
+        validators["etag"] = headers["ETag"]
+    if headers.get("Last-Modified"):
+        validators["last_modified"] = headers["Last-Modified"]
+    return validators
+
+
+def stream_to_file(source, path: pathlib.Path) -> None:
+    """Copy a readable response into path, removing the partial file on failure."""
+    # Unlink first: the path may be a hardlink shared with an earlier snapshot.
+    path.unlink(missing_ok=True)
+    try:
+        with open(path, "wb", buffering=WRITE_BUFFER_SIZE) as handle:
+            if GZIP_SNAPSHOTS:
+                with gzip.GzipFile(
+                    filename="", mode="wb", compresslevel=1, fileobj=handle, mtime=0
+                ) as compressed:
+                    shutil.copyfileobj(source, compressed, COPY_CHUNK_SIZE)
+            else:
+                shutil.copyfileobj(source, handle, COPY_CHUNK_SIZE)
+    except BaseException:
+        path.unlink(missing_ok=True)
+        raise
+
+
+def fetch_to_file(
+    url: str, path: pathlib.Path, extra_headers: dict[str, str] | None = None
+) -> tuple[bool, dict[str, str]]:
+    """Stream the body from URL into path, raising on HTTP errors.
+
+    Returns whether a body was written (False on 304 Not Modified, leaving
+    path untouched) and the response validators.
+    """
+    headers = {**HEADERS, **(extra_headers or {})}
+    if POOL is not None:
+        response = POOL.request("GET", url, headers=headers, timeout=30, preload_content=False)
+        try:
+            if response.status == 304:
+                return False, response_validators(response.headers)
+            if response.status >= 300:
+                raise urllib.error.HTTPError(url, response.status, response.reason, None, None)
+            stream_to_file(response, path)
+            return True, response_validators(response.headers)
+        finally:
+            response.drain_conn()
+            response.release_conn()
+
+    request = urllib.request.Request(url, headers=headers, method="GET")
+    try:
+        with urllib.request.urlopen(request, timeout=30) as response:
+            # urllib3 decodes gzip itself; urllib hands back the raw stream.
+            if response.headers.get("Content-Encoding", "").lower() == "gzip":
+                stream_to_file(gzip.GzipFile(fileobj=response), path)
+            else:
+                stream_to_file(response, path)
+            return True, response_validators(response.headers)
+    except urllib.error.HTTPError as err:
+        if err.code == 304:
+            return False, response_validators(err.headers)
+        raise
+
+
+def read_snapshot(path: pathlib.Path) -> bytes:
+    """Return the JSON bytes stored at path, decompressing when gzip storage is on."""
+    # Decide from the setting, not the suffix: part files end in ".part".
+    data = path.read_bytes()
+    return gzip.decompress(data) if GZIP_SNAPSHOTS else data
+
+
+def store_object(part_path: pathlib.Path, objects_dir: pathlib.Path, digest: str) -> pathlib.Path:
+    """Move a downloaded payload into the content store, keeping any existing copy."""
+    object_path = objects_dir / f"{digest}{SNAPSHOT_SUFFIX}"
+    if object_path.exists():
+        part_path.unlink()
+    else:
+        os.replace(part_path, object_path)
+    return object_path
+
+
+def previous_copy(
+    root: pathlib.Path, objects_dir: pathlib.Path, cached: dict[str, object]
+) -> pathlib.Path | None:
+    """Return a surviving copy of a previous manifest entry's payload, if any."""
+    candidates = [root / cached["path"]]
+    if cached.get("blake2b"):
+        candidates.append(objects_dir / f"{cached['blake2b']}{SNAPSHOT_SUFFIX}")
+    for candidate in candidates:
+        if candidate.is_file():
+            return candidate
+    return None
+
+
+def link_or_copy(source: pathlib.Path, target: pathlib.Path) -> None:
+    """Hardlink source to target, copying when linking is not possible."""
+    target.unlink(missing_ok=True)
+    try:
+        os.link(source, target)
+    except OSError:
+        shutil.copyfile(source, target)
+
+
+def ensure_json(body: bytes, key: str, log: list[str]) -> None:
+    """Validate that body parses as JSON, adding a warning to log on failure.
+
+    Warnings are written to stderr when the log is flushed.
+    """
+    try:
+        json_loads(body)
+    except ValueError as exc:
+        log.append(f"{WARNING_PREFIX}{key} response is not valid JSON: {exc}")
+
+
+def write_atomic(path: pathlib.Path, payload: bytes) -> None:
+    """Write payload to path so readers never observe a partial file."""
+    tmp_path = path.with_name(f"{path.name}.tmp")
+    try:
+        with open(tmp_path, "wb") as handle:
+            handle.write(payload)
+            handle.flush()
+            os.fsync(handle.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def encode_manifest(summary: dict[str, object]) -> bytes:
+    """Serialise the manifest as two-space indented JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(summary, option=orjson.OPT_INDENT_2)
+    return json.dumps(summary, indent=2).encode("utf-8")
+
+
+def fetch_attempt(
+    url: str, part_path: pathlib.Path, cached: dict[str, object] | None
+) -> tuple[bool, dict[str, str]]:
+    """Download one candidate URL into its own part file."""
+    written, validators = fetch_to_file(url, part_path, conditional_headers(cached))
+    if not written and cached is None:
+        raise ValueError("unexpected 304 Not Modified")
+    return written, validators
+
+
+def describe_failure(err: Exception) -> str:
+    """Render a fetch error for the progress log."""
+    if isinstance(err, urllib.error.HTTPError):
+        return f"{err.code} {err.reason}"
+    if isinstance(err, urllib.error.URLError):
+        return str(err.reason)
+    return str(err)
+
 
+def snapshot_endpoint(
+    key: str,
+    urls: tuple[str, ...],
+    snapshot_dir: pathlib.Path,
+    root: pathlib.Path,
+    objects_dir: pathlib.Path,
+    previous: dict[str, object] | None = None,
+) -> tuple[dict[str, object], list[str]]:
+    """Save one endpoint from the first of its paths that succeeds.
+
+    Each path downloads into its own part file. A fallback is only requested
+    once the path before it fails or has not answered within
+    ``FALLBACK_DELAY`` seconds, and results are taken in preference order. The
+    winner is filed in ``objects_dir`` under its BLAKE2b digest and hardlinked
+    into the snapshot, so identical payloads across runs share one copy on
+    disk.
+
+    When ``previous`` (the last manifest entry for this endpoint) carries
+    validators for the same URL, the request is conditional and a 304 reuses
+    the earlier file.
+
+    Returns the manifest entry together with the log lines for the attempts.
+    """
+    file_path = snapshot_dir / f"{key}{SNAPSHOT_SUFFIX}"
+    manifest_path = str(file_path.relative_to(root))
+    log: list[str] = []
+
+    executor = ThreadPoolExecutor(max_workers=len(urls))
+    attempts = []
+
+    def start_attempt(index: int) -> None:
+        url = urls[index]
+        cached = previous if previous and previous.get("url") == url else None
+        if cached and not cached["path"].endswith(SNAPSHOT_SUFFIX):
+            cached = None  # stored in the other format, so download it again
+        part_path = snapshot_dir / f"{key}{SNAPSHOT_SUFFIX}.{index}.part"
+        future = executor.submit(fetch_attempt, url, part_path, cached)
+        attempts.append((url, part_path, cached, future))
 
-def ensure_json(text: str, key: str) -> None:
-    """Validate that text parses as JSON, warning on failure."""
     try:
-        json.loads(text)
-    except json.JSONDecodeError as exc:
-        print(f"Warning: {key} response is not valid JSON: {exc}", file=sys.stderr)
+        for index in range(len(urls)):
+            if index == len(attempts):
+                start_attempt(index)
+            url, part_path, cached, future = attempts[index]
+            # A slow preferred path should not hold up its fallback for the
+            # full timeout, so start the next path if this one stalls.
+            if len(attempts) == index + 1 < len(urls) and not wait(
+                [future], timeout=FALLBACK_DELAY
+            ).done:
+                start_attempt(index + 1)
+            try:
+                written, validators = future.result()
+                entry = {"key": key, "path": manifest_path, "url": url}
+
+                if not written:
+                    source = previous_copy(root, objects_dir, cached)
+                    if source is not None:
+                        link_or_copy(source, file_path)
+                        for field in ("etag", "last_modified", "blake2b"):
+                            if field in cached:
+                                entry[field] = cached[field]
+                        entry.update(validators)
+                        log.append(f"Fetching {url} ... not modified (reused)")
+                        return entry, log
+                    # Nothing changed upstream, but the earlier copy is gone.
+                    written, validators = fetch_attempt(url, part_path, None)
+
+                body = read_snapshot(part_path)
+                digest = hashlib.blake2b(body, digest_size=32).hexdigest()
+                link_or_copy(store_object(part_path, objects_dir, digest), file_path)
+                entry.update(validators)
+                entry["blake2b"] = digest
+
+                log.append(f"Fetching {url} ... saved")
+                ensure_json(body, key, log)
+                return entry, log
+            except Exception as err:  # pylint: disable=broad-except
+                log.append(f"Fetching {url} ... failed ({describe_failure(err)})")
+    finally:
+        executor.shutdown(wait=False)
+        # Losers may still be downloading; drop their part files once they stop.
+        for _, part_path, _, future in attempts:
+            future.cancel()
+            future.add_done_callback(lambda _, path=part_path: path.unlink(missing_ok=True))
+
+    return {
+        "key": key,
+        "error": " | ".join(urls),
+        "message": "All attempts failed",
+    }, log
 
 
 def main() -> int:
@@ -72,6 +388,9 @@ def main() -> int:
     root = pathlib.Path(__file__).resolve().parents[1]
     snapshot_dir = root / "snapshots" / "nof1" / date_part / time_part
     snapshot_dir.mkdir(parents=True, exist_ok=True)
+    objects_dir = root / "snapshots" / "nof1" / "_objects"
+    objects_dir.mkdir(exist_ok=True)
+    previous = load_previous_validators(root, snapshot_dir)
 
     summary: dict[str, object] = {
         "base": BASE_URL,
@@ -81,51 +400,41 @@ def main() -> int:
         "files": [],
     }
 
-    for endpoint in ENDPOINTS:
-        key = endpoint["key"]
-        attempted_urls: list[str] = []
-        success = False
-
-        for rel_path in endpoint["paths"]:
-            url = f"{BASE_URL}{rel_path}"
-            attempted_urls.append(url)
-            print(f"Fetching {url} ... ", end="", flush=True)
-            try:
-                text = fetch(url)
-                ensure_json(text, key)
-
-                file_path = snapshot_dir / f"{key}.json"
-                file_path.write_text(text, encoding="utf-8")
-
-                summary["files"].append(
-                    {
-                        "key": key,
-                        "path": str(file_path.relative_to(root)),
-                        "url": url,
-                    }
-                )
-                print("saved")
-                success = True
-                break
-            except urllib.error.HTTPError as err:
-                print(f"failed ({err.code} {err.reason})")
-            except urllib.error.URLError as err:
-                print(f"failed ({err.reason})")
-            except Exception as err:  # pylint: disable=broad-except
-                print(f"failed ({err})")
-
-        if not success:
-            summary["files"].append(
-                {
-                    "key": key,
-                    "error": " | ".join(attempted_urls),
-                    "message": "All attempts failed",
-                }
+    # The endpoints are independent and network-bound, so fetch them in
+    # parallel; the manifest and the log keep the ENDPOINTS order regardless.
+    with ThreadPoolExecutor(max_workers=len(ENDPOINTS)) as executor:
+        futures = [
+            executor.submit(
+                snapshot_endpoint,
+                key,
+                urls,
+                snapshot_dir,
+                root,
+                objects_dir,
+                previous.get(key),
             )
+            for key, urls in ENDPOINT_URLS
+        ]
+        results = [future.result() for future in futures]
+    summary["files"].extend(entry for entry, _ in results)
 
     index_path = snapshot_dir / "index.json"
-    index_path.write_text(json.dumps(summary, indent=2), encoding="utf-8")
-    print(f"\nSnapshot complete -> {snapshot_dir.relative_to(root)}")
+    write_atomic(index_path, encode_manifest(summary))
+
+    # Progress goes to stdout in one write; warnings still go to stderr, each
+    # emitted right after the progress lines of the endpoint it belongs to.
+    pending: list[str] = []
+    for _, log in results:
+        for line in log:
+            if line.startswith(WARNING_PREFIX):
+                sys.stdout.write("".join(pending))
+                sys.stdout.flush()
+                pending.clear()
+                sys.stderr.write(f"{line}\n")
+            else:
+                pending.append(f"{line}\n")
+    pending.append(f"\nSnapshot complete -> {snapshot_dir.relative_to(root)}\n")
+    sys.stdout.write("".join(pending))
     return 0
 
 